@@ -4,10 +4,15 @@ Alfred Mission Control Dashboard
 Real-time visibility into agent operations
 """
 
+import html
 import json
+import logging
 import os
 import time
+from collections import deque
 from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +24,25 @@ try:
 except ImportError:
     HAS_AUTOREFRESH = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson parses bytes directly and is several times faster than stdlib json;
+# its JSONDecodeError subclasses json.JSONDecodeError so handlers work for both
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(iso_str: str) -> datetime:
+        """Stdlib fallback for ciso8601.parse_datetime."""
+        if iso_str.endswith("Z"):
+            iso_str = iso_str[:-1] + "+00:00"
+        return datetime.fromisoformat(iso_str)
+
 # Page config - MUST be first Streamlit command
 st.set_page_config(
     page_title="Alfred Mission Control",
@@ -27,68 +51,305 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
+logger = logging.getLogger(__name__)
+
 # Configuration
 WORKSPACE_PATH = os.environ.get("WORKSPACE_PATH", "")
 DATA_SUBDIR = "memory/dashboard"
 LOCAL_DATA_PATH = Path(__file__).parent / "data"
 REFRESH_INTERVAL = 30  # seconds
+CACHE_MAX_ENTRIES = 64  # parsed file versions kept per loader
 AUTO_REFRESH_ENABLED = True
 VERSION = "1.0.0"
+HOME_ACTIVITY_LIMIT = 10  # events parsed for the Home page
+LIST_PAGE_SIZE = 25  # cards rendered per "Load more" step
+HISTORY_PAGE_SIZE = 50  # messages shown per "Load earlier" step
+NAV_TABS = ["🏠 Home", "💬 Chat", "🤖 Agents", "⏰ Jobs", "📦 Files", "📋 Log"]
+
+
+# Custom CSS with mobile optimization
+_APP_CSS = """
+<style>
+    /* Base dark theme */
+    .stApp { background-color: #030712; }
+    .stMarkdown { color: #e5e7eb; }
+    section[data-testid="stSidebar"] { background-color: #111827; }
+
+    /* Buttons - larger touch targets */
+    .stButton > button {
+        background-color: #1f2937;
+        color: #e5e7eb;
+        border: 1px solid #374151;
+        min-height: 44px;
+        padding: 8px 16px;
+    }
+    .stButton > button:hover {
+        background-color: #374151;
+        border-color: #4b5563;
+    }
+
+    /* Form elements */
+    .stSelectbox > div > div { background-color: #1f2937; color: #e5e7eb; }
+
+    /* Navigation - tab-styled radio, responsive */
+    .stRadio [role="radiogroup"] { 
+        gap: 4px;
+        flex-wrap: wrap;
+    }
+    .stRadio [role="radiogroup"] > label {
+        background-color: #1f2937;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: #9ca3af;
+        font-size: 14px;
+        min-height: 44px;
+        margin: 0;
+    }
+    .stRadio [role="radiogroup"] > label > div:first-child { display: none; }
+    .stRadio [role="radiogroup"] > label:has(input:checked) {
+        background-color: #374151;
+        color: #ffffff;
+    }
+
+    /* Mobile-specific styles */
+    @media (max-width: 768px) {
+        /* Smaller text on mobile */
+        .stMarkdown h1 { font-size: 1.5rem !important; }
+        .stMarkdown h3 { font-size: 1.1rem !important; }
+
+        /* Stack tabs vertically on very small screens */
+        .stRadio [role="radiogroup"] {
+            gap: 2px;
+        }
+        .stRadio [role="radiogroup"] > label {
+            padding: 6px 8px;
+            font-size: 12px;
+        }
+
+        /* Metric cards stack better */
+        .stMetric { padding: 8px !important; }
+
+        /* Cards full width */
+        [data-testid="column"] {
+            padding: 0 4px !important;
+        }
+    }
+
+    /* Hide Streamlit branding */
+    #MainMenu { visibility: hidden; }
+    footer { visibility: hidden; }
+
+    /* Smooth transitions */
+    * { transition: background-color 0.2s, border-color 0.2s; }
+</style>
+"""
+
+_REFRESH_FOOTER = '<div style="color: #6b7280; font-size: 11px;">v{version} • Updated {updated} • Auto-refresh {interval}s</div>'
+
 
+def stat_data_file(filename: str) -> Optional[tuple]:
+    """Resolve and stat a data file, returning (path, stat_result) or None.
 
-def get_data_path(filename: str) -> Optional[Path]:
-    """Get path to data file, checking workspace first then local."""
+    stat() doubles as the exists() check. The workspace candidate is always
+    tried first, so a local fallback never hides a workspace file that
+    appears later.
+    """
     if WORKSPACE_PATH:
         workspace_file = Path(WORKSPACE_PATH) / DATA_SUBDIR / filename
-        if workspace_file.exists():
-            return workspace_file
+        try:
+            return workspace_file, workspace_file.stat()
+        except OSError:
+            pass
     
     local_file = LOCAL_DATA_PATH / filename
-    if local_file.exists():
-        return local_file
-    
-    return None
+    try:
+        return local_file, local_file.stat()
+    except OSError:
+        return None
 
 
-@st.cache_data(ttl=10)  # Cache for 10 seconds
-def load_json_file(filename: str) -> Optional[dict]:
-    """Load JSON file, return None if not found."""
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def tail_lines(path: Path, n: int, end: Optional[int] = None) -> list:
+    """Return the last N lines of a file as bytes, reading backwards from EOF.
+
+    Only touches the trailing blocks needed to find N newlines, so memory and
+    I/O stay constant no matter how large the log grows. `end` caps the read
+    at a byte offset (e.g. a size from an earlier stat) instead of EOF.
+    """
+    if n <= 0:
+        return []
+    with open(path, "rb") as f:
+        if end is None:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+        pos = end
+        buf = b""
+        # Need n + 1 newlines to be sure the first kept line is complete
+        while pos > 0 and buf.count(b"\n") <= n:
+            read_size = min(TAIL_BLOCK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + buf
+    # One C-level split on the JSONL record separator; no readline() state
+    lines = buf.split(b"\n")
+    if not lines[-1]:
+        lines.pop()  # Trailing newline
+    return lines[-n:]
+
+
+def parse_jsonl_lines(lines: list) -> list:
+    """Parse raw JSONL lines, skipping blank and malformed ones.
+
+    Lines are parsed as one JSON array in a single call. The result is only
+    kept if it has one entry per line; a parse failure or a count mismatch
+    (a record split across lines, or a bare "1,2" line) falls back to
+    parsing line by line.
+    """
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return []
     try:
-        full_path = get_data_path(filename)
-        if full_path and full_path.exists():
-            with open(full_path) as f:
-                return json.load(f)
-    except json.JSONDecodeError as e:
-        # Silent fail for JSON errors - data may be updating
+        result = json_loads(b"[" + b",".join(lines) + b"]")
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        pass
+    else:
+        if len(result) == len(lines):
+            return result
+    
+    result = []
+    for line in lines:
+        try:
+            result.append(json_loads(line))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue  # Skip malformed lines
+    return result
+
+
+# The (mtime_ns, size) key is authoritative, so entries never need a TTL;
+# max_entries bounds the stale keys left behind as files change.
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Optional[dict]:
+    """Parse a JSON file. mtime_ns/size are only part of the cache key."""
+    try:
+        return json_loads(Path(path_str).read_bytes())
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        # No st.error here - the writer may be mid-update, and a flashing
+        # error on every rerun is worse than a briefly empty panel
+        logger.warning("Error loading %s: %s", path_str, e)
         return None
-    except Exception as e:
-        # Only show error for unexpected issues
-        if "ENOENT" not in str(e) and "No such file" not in str(e):
-            st.error(f"Error loading {filename}: {e}")
-    return None
 
 
-@st.cache_data(ttl=10)  # Cache for 10 seconds
-def load_jsonl_file(filename: str, limit: int = 100) -> list:
-    """Load JSONL file, return last N entries."""
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_jsonl_window(path_str: str, mtime_ns: int, size: int, limit: int) -> tuple:
+    """Parse the last N entries of a JSONL file and count all of its lines.
+
+    Returns (entries, total). mtime_ns/size are only part of the cache key;
+    the count is a raw newline scan, so lines outside the window are never
+    parsed.
+    """
+    path = Path(path_str)
     try:
-        full_path = get_data_path(filename)
-        if full_path and full_path.exists():
-            with open(full_path) as f:
-                lines = f.readlines()
-                recent = lines[-limit:] if len(lines) > limit else lines
-                result = []
-                for line in recent:
-                    if line.strip():
-                        try:
-                            result.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue  # Skip malformed lines
-                return result
-    except Exception as e:
-        if "ENOENT" not in str(e) and "No such file" not in str(e):
-            st.error(f"Error loading {filename}: {e}")
-    return []
+        total = 0
+        last_byte = b""
+        with open(path, "rb") as f:
+            remaining = size
+            while remaining > 0:
+                block = f.read(min(TAIL_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                total += block.count(b"\n")
+                remaining -= len(block)
+                last_byte = block[-1:]
+        if last_byte not in (b"", b"\n"):
+            total += 1  # Unterminated last line
+        return parse_jsonl_lines(tail_lines(path, limit, end=size)), total
+    except OSError as e:
+        logger.warning("Error loading %s: %s", path_str, e)
+        return [], 0
+
+
+def file_cache_key(filename: str) -> Optional[tuple]:
+    """Return a data file's (path, mtime_ns, size) cache key, or None if missing."""
+    found = stat_data_file(filename)
+    if not found:
+        return None
+    full_path, st_result = found
+    return str(full_path), st_result.st_mtime_ns, st_result.st_size
+
+
+def load_json_file(filename: str) -> Optional[dict]:
+    """Load JSON file, return None if not found.
+
+    Cached on (path, mtime, size) so unchanged files are never re-read.
+    """
+    key = file_cache_key(filename)
+    if not key:
+        return None
+    return _load_json_cached(*key)
+
+
+def incremental_tail(filename: str, state_key: str, limit: int) -> deque:
+    """Return the last N entries of an append-only JSONL file.
+
+    The read offset and parsed entries are kept in session state, so each
+    refresh only parses bytes appended since the previous one. A new inode
+    or a shrinking file (rotation/truncation) triggers a full re-tail.
+    The bounded deque itself is returned; callers must not mutate it.
+    """
+    found = stat_data_file(filename)
+    if not found:
+        return deque(maxlen=limit)
+    path, st_result = found
+
+    state = st.session_state.get(state_key)
+    reset = (
+        state is None
+        or state["path"] != str(path)
+        or state["ino"] != st_result.st_ino
+        or st_result.st_size < state["offset"]
+        or state["events"].maxlen != limit
+    )
+
+    try:
+        with open(path, "rb") as f:
+            if reset:
+                # Read up to the stat'd size only; anything appended since is
+                # picked up from `offset` on the next poll
+                offset = st_result.st_size
+                # One extra line in case the last is half-written
+                lines = tail_lines(path, limit + 1, end=offset)
+                # Leave a half-written trailing line for the next poll
+                if offset:
+                    f.seek(offset - 1)
+                    if f.read(1) != b"\n" and lines:
+                        offset -= len(lines.pop())
+                lines = lines[-limit:]
+                state = {
+                    "path": str(path),
+                    "ino": st_result.st_ino,
+                    "offset": offset,
+                    "events": deque(parse_jsonl_lines(lines), maxlen=limit),
+                }
+                st.session_state[state_key] = state
+            elif st_result.st_size > state["offset"]:
+                f.seek(state["offset"])
+                new = f.read(st_result.st_size - state["offset"])
+                complete, sep, _ = new.rpartition(b"\n")
+                if sep:
+                    state["events"].extend(parse_jsonl_lines(complete.split(b"\n")))
+                    state["offset"] += len(complete) + 1
+    except OSError as e:
+        logger.warning("Error tailing %s: %s", path, e)
+        return deque(maxlen=limit) if reset else state["events"]
+
+    return state["events"]
+
+
+def begin_run():
+    """Start a fresh data snapshot for a full or fragment rerun."""
+    st.session_state["_now"] = datetime.now(timezone.utc)
 
 
 def get_agent_status() -> dict:
@@ -112,69 +373,215 @@ def get_sessions() -> list:
     return []
 
 
-def get_session_history(session_key: str) -> list:
-    """Get message history for a session."""
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_sessions_by_key(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Index sessions.json by session key. mtime_ns/size are only part of the cache key."""
+    sessions_file = _load_json_cached(path_str, mtime_ns, size)
+    sessions = sessions_file.get("sessions", []) if sessions_file else []
+    return {s["key"]: s for s in sessions if isinstance(s.get("key"), str)}
+
+
+def get_sessions_by_key() -> dict:
+    """Get sessions indexed by session key.
+
+    The index is built once per sessions.json version, not once per view.
+    """
+    key = file_cache_key("sessions.json")
+    if not key:
+        return {}
+    return _load_sessions_by_key(*key)
+
+
+def get_session_history(session_key: str, limit: int) -> tuple:
+    """Get the last `limit` messages of a session, oldest first, and the total.
+
+    Reads the append-friendly history_<key>.jsonl when present, falling back
+    to the legacy history_<key>.json document.
+    """
+    found = stat_data_file(f"history_{session_key}.jsonl")
+    if found:
+        path, st_result = found
+        return _load_jsonl_window(str(path), st_result.st_mtime_ns, st_result.st_size, limit)
+    
     history_file = load_json_file(f"history_{session_key}.json")
-    if history_file:
-        return history_file.get("messages", [])
-    return []
+    messages = history_file.get("messages", []) if history_file else []
+    return messages[-limit:], len(messages)
 
 
-def get_subagent_tasks() -> list:
+def get_subagent_tasks() -> deque:
     """Get sub-agent task log."""
-    return load_jsonl_file("subagent-log.jsonl", limit=50)
+    return incremental_tail("subagent-log.jsonl", "_tail_subagent_log", limit=50)
+
+
+def get_activity_feed(limit: int = 100) -> deque:
+    """Get the last `limit` activity events."""
+    # Tail state is per limit so pages with different limits don't reset it
+    return incremental_tail("activity-feed.jsonl", f"_tail_activity_feed_{limit}", limit=limit)
+
+
+# Sessions filter label -> session kind
+_KIND_MAP = {"Main": "main", "Sub-Agent": "subagent", "Cron": "cron"}
+
+# Activity filter label -> event types
+_ACTIVITY_TYPE_MAP = {
+    "Sessions": frozenset({"session_started", "session_ended"}),
+    "Tasks": frozenset({"task_started", "task_completed", "task_failed"}),
+    "Deliverables": frozenset({"deliverable_created"}),
+    "Errors": frozenset({"error_occurred", "task_failed"}),
+}
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_sessions_by_kind(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Bucket sessions.json by Sessions filter label, including "All".
+
+    mtime_ns/size are only part of the cache key.
+    """
+    sessions_file = _load_json_cached(path_str, mtime_ns, size)
+    sessions = sessions_file.get("sessions", []) if sessions_file else []
+    buckets = {"All": sessions}
+    buckets.update((label, []) for label in _KIND_MAP)
+    label_for_kind = {kind: label for label, kind in _KIND_MAP.items()}
+    for session in sessions:
+        label = label_for_kind.get(str(session.get("kind")))
+        if label:
+            buckets[label].append(session)
+    return buckets
+
+
+def get_sessions_by_kind() -> dict:
+    """Get sessions bucketed by Sessions filter label, including "All".
+
+    Bucketed once per sessions.json version, so a filter change is a lookup.
+    """
+    key = file_cache_key("sessions.json")
+    if not key:
+        return {}
+    return _load_sessions_by_kind(*key)
+
+
+def get_activity_by_type(limit: int = 100) -> dict:
+    """Get activity events bucketed by Activity filter label, including "All".
+
+    Buckets are kept in session state and rebuilt only when the tail deque
+    changes (a re-tail or newly appended events), so a filter change is a
+    lookup.
+    """
+    events = get_activity_feed(limit=limit)
+    last = events[-1] if events else None
+    memo_key = f"_activity_buckets_{limit}"
+    memo = st.session_state.get(memo_key)
+    if memo and memo["events"] is events and memo["last"] is last:
+        return memo["buckets"]
+    
+    buckets = {"All": events}
+    buckets.update((label, []) for label in _ACTIVITY_TYPE_MAP)
+    for event in events:
+        event_type = str(event.get("type"))
+        for label, types in _ACTIVITY_TYPE_MAP.items():
+            if event_type in types:
+                buckets[label].append(event)
+    st.session_state[memo_key] = {"events": events, "last": last, "buckets": buckets}
+    return buckets
+
 
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_cron_jobs(path_str: str, mtime_ns: int, size: int) -> list:
+    """Load cron-jobs.json with display-truncated text in text_short.
 
-def get_activity_feed() -> list:
-    """Get activity event feed."""
-    return load_jsonl_file("activity-feed.jsonl", limit=100)
+    mtime_ns/size are only part of the cache key.
+    """
+    cron_file = _load_json_cached(path_str, mtime_ns, size)
+    jobs = cron_file.get("jobs", []) if cron_file else []
+    for job in jobs:
+        job["text_short"] = str(job.get("text") or "")[:80]
+    return jobs
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_deliverables_grouped(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Load deliverables.json grouped by category, in first-seen order.
+
+    Items get a display-truncated description_short. mtime_ns/size are only
+    part of the cache key.
+    """
+    deliverables_file = _load_json_cached(path_str, mtime_ns, size)
+    items = deliverables_file.get("items", []) if deliverables_file else []
+    categories = {}
+    for item in items:
+        item["description_short"] = str(item.get("description") or "")[:100]
+        categories.setdefault(str(item.get("category", "Uncategorized")), []).append(item)
+    return categories
 
 
 def get_cron_jobs() -> list:
-    """Get cron job list."""
-    cron_file = load_json_file("cron-jobs.json")
-    if cron_file:
-        return cron_file.get("jobs", [])
-    return []
+    """Get cron job list, truncated once per file version."""
+    key = file_cache_key("cron-jobs.json")
+    if not key:
+        return []
+    return _load_cron_jobs(*key)
 
 
-def get_deliverables() -> list:
-    """Get deliverables catalog."""
-    deliverables_file = load_json_file("deliverables.json")
-    if deliverables_file:
-        return deliverables_file.get("items", [])
-    return []
+def get_deliverables_grouped() -> dict:
+    """Get deliverables by category, grouped and truncated once per file version."""
+    key = file_cache_key("deliverables.json")
+    if not key:
+        return {}
+    return _load_deliverables_grouped(*key)
 
 
 def format_timestamp(iso_str: str) -> str:
-    """Format ISO timestamp for display."""
+    """Format ISO timestamp for display; unparseable input comes back escaped."""
+    if not isinstance(iso_str, str):
+        # Also keeps unhashable values (lists, dicts) away from the lru_cache
+        return html.escape(str(iso_str or ""))
+    return _format_timestamp_cached(iso_str)
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_cached(iso_str: str) -> str:
+    """Memoized format_timestamp for string input."""
+    if not iso_str:
+        return iso_str
     try:
-        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+        dt = parse_datetime(iso_str)
         return dt.strftime("%I:%M %p").lstrip("0")
-    except:
+    except (ValueError, TypeError, AttributeError):
+        return html.escape(str(iso_str))
+
+
+def format_time_ago(iso_str: str, now: Optional[datetime] = None) -> str:
+    """Format as 'X min ago'; unparseable input comes back escaped.
+
+    `now` defaults to the per-rerun timestamp begin_run() stores in session
+    state; pages rendering many rows can also pass one in explicitly.
+    """
+    if not isinstance(iso_str, str):
+        return html.escape(str(iso_str or ""))
+    if not iso_str:
         return iso_str
+    now = now or st.session_state.get("_now") or datetime.now(timezone.utc)
+    return _format_time_ago_cached(iso_str, int(now.timestamp() // 60))
 
 
-def format_time_ago(iso_str: str) -> str:
-    """Format as 'X min ago'."""
+@lru_cache(maxsize=4096)
+def _format_time_ago_cached(iso_str: str, now_minute: int) -> str:
+    """Memoized format_time_ago; now_minute keeps entries valid for ~60s."""
     try:
-        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        now = datetime.now(timezone.utc)
-        diff = now - dt
-        
-        if diff.total_seconds() < 60:
-            return "just now"
-        elif diff.total_seconds() < 3600:
-            mins = int(diff.total_seconds() / 60)
-            return f"{mins} min ago"
-        elif diff.total_seconds() < 86400:
-            hours = int(diff.total_seconds() / 3600)
-            return f"{hours}h ago"
-        else:
-            days = int(diff.total_seconds() / 86400)
-            return f"{days}d ago"
-    except:
-        return iso_str
+        dt = parse_datetime(iso_str)
+        now = datetime.fromtimestamp(now_minute * 60, timezone.utc)
+        seconds = (now - dt).total_seconds()
+    except (ValueError, TypeError, AttributeError):
+        return html.escape(str(iso_str))
+    
+    if seconds < 60:
+        return "just now"
+    elif seconds < 3600:
+        return f"{int(seconds / 60)} min ago"
+    elif seconds < 86400:
+        return f"{int(seconds / 3600)}h ago"
+    else:
+        return f"{int(seconds / 86400)}d ago"
 
 
 # =============================================================================
@@ -222,78 +629,109 @@ def render_metric_card(label: str, value: str, subtitle: str = ""):
     )
 
 
+_SESSION_STATUS_COLORS = {"active": "#22c55e", "idle": "#eab308", "closed": "#6b7280"}
+_KIND_EMOJI = {"main": "💬", "subagent": "🤖", "cron": "⏰"}
+
+
+_SESSION_CARD_TMPL = (
+    '<div style="background: #111827; border: 1px solid #1f2937; border-radius: 12px; padding: 16px; margin-bottom: 8px;">'
+    '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">'
+    '<div style="display: flex; align-items: center; gap: 8px;">'
+    '<span style="color: {color}; font-size: 16px;">●</span>'
+    '<span style="color: #ffffff; font-weight: 600;">{kind_emoji} {key}</span>'
+    '</div>'
+    '<span style="color: #6b7280; font-size: 14px;">{timestamp}</span>'
+    '</div>'
+    '<div style="color: #9ca3af; font-size: 14px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{last_msg}</div>'
+    '</div>'
+)
+
+
+def build_session_card_html(session: dict) -> str:
+    """Build the HTML for a session card."""
+    last_msg = str(session.get("last_message_preview") or "")[:80]
+    return _SESSION_CARD_TMPL.format_map({
+        "color": _SESSION_STATUS_COLORS.get(str(session.get("status", "active")), "#6b7280"),
+        "kind_emoji": _KIND_EMOJI.get(str(session.get("kind", "main")), "📋"),
+        "key": html.escape(str(session.get("key") or "unknown")),
+        "timestamp": format_timestamp(session.get("last_activity", "")),
+        "last_msg": html.escape(last_msg) if last_msg else "<em>No messages</em>",
+    })
+
+
 def render_session_card(session: dict, show_button: bool = True):
-    """Render a session card."""
-    status_colors = {"active": "#22c55e", "idle": "#eab308", "closed": "#6b7280"}
-    status = session.get("status", "active")
-    color = status_colors.get(status, "#6b7280")
-    kind = session.get("kind", "main")
-    key = session.get("key", "unknown")
-    last_msg = session.get("last_message_preview", "")[:80]
-    timestamp = format_timestamp(session.get("last_activity", ""))
-    kind_emoji = {"main": "💬", "subagent": "🤖", "cron": "⏰"}.get(kind, "📋")
-    
-    st.markdown(
-        f"""
-        <div style="background: #111827; border: 1px solid #1f2937; border-radius: 12px; padding: 16px; margin-bottom: 8px;">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                <div style="display: flex; align-items: center; gap: 8px;">
-                    <span style="color: {color}; font-size: 16px;">●</span>
-                    <span style="color: #ffffff; font-weight: 600;">{kind_emoji} {key}</span>
-                </div>
-                <span style="color: #6b7280; font-size: 14px;">{timestamp}</span>
-            </div>
-            <div style="color: #9ca3af; font-size: 14px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">
-                {last_msg if last_msg else "<em>No messages</em>"}
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    """Render a session card, optionally followed by its history button."""
+    st.markdown(build_session_card_html(session), unsafe_allow_html=True)
     
     if show_button:
+        key = session.get("key", "unknown")
         if st.button(f"View History →", key=f"btn_{key}"):
             st.session_state.selected_session = key
             st.session_state.page = "session_detail"
             st.rerun()
 
 
-def render_activity_item(event: dict):
-    """Render an activity feed item."""
-    type_config = {
-        "session_started": ("💬", "#22c55e"),
-        "session_ended": ("⏹️", "#6b7280"),
-        "task_started": ("◐", "#eab308"),
-        "task_completed": ("✓", "#22c55e"),
-        "task_failed": ("✗", "#ef4444"),
-        "deliverable_created": ("📄", "#3b82f6"),
-        "cron_executed": ("⏰", "#8b5cf6"),
-        "error_occurred": ("⚠️", "#ef4444"),
-    }
-    
-    event_type = event.get("type", "unknown")
-    icon, color = type_config.get(event_type, ("•", "#6b7280"))
-    summary = event.get("summary", "Unknown event")
-    timestamp = format_timestamp(event.get("timestamp", ""))
-    
-    st.markdown(
-        f"""
-        <div style="display: flex; align-items: flex-start; gap: 12px; padding: 8px 0; border-bottom: 1px solid #1f2937;">
-            <span style="color: {color}; font-size: 16px; width: 24px;">{icon}</span>
-            <div style="flex: 1;">
-                <div style="color: #e5e7eb; font-size: 14px;">{summary}</div>
-                <div style="color: #6b7280; font-size: 12px;">{timestamp}</div>
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+# Activity event type -> (icon, color)
+_ACTIVITY_TYPE_CONFIG = {
+    "session_started": ("💬", "#22c55e"),
+    "session_ended": ("⏹️", "#6b7280"),
+    "task_started": ("◐", "#eab308"),
+    "task_completed": ("✓", "#22c55e"),
+    "task_failed": ("✗", "#ef4444"),
+    "deliverable_created": ("📄", "#3b82f6"),
+    "cron_executed": ("⏰", "#8b5cf6"),
+    "error_occurred": ("⚠️", "#ef4444"),
+}
+_DEFAULT_ACTIVITY_TYPE = ("•", "#6b7280")
+
+
+_ACTIVITY_TMPL = (
+    '<div style="display: flex; align-items: flex-start; gap: 12px; padding: 8px 0; border-bottom: 1px solid #1f2937;">'
+    '<span style="color: {color}; font-size: 16px; width: 24px;">{icon}</span>'
+    '<div style="flex: 1;">'
+    '<div style="color: #e5e7eb; font-size: 14px;">{summary}</div>'
+    '<div style="color: #6b7280; font-size: 12px;">{timestamp}</div>'
+    '</div>'
+    '</div>'
+)
+
+
+def build_activity_item_html(event: dict) -> str:
+    """Build the HTML for an activity feed item."""
+    icon, color = _ACTIVITY_TYPE_CONFIG.get(str(event.get("type")), _DEFAULT_ACTIVITY_TYPE)
+    return _ACTIVITY_TMPL.format_map({
+        "icon": icon,
+        "color": color,
+        "summary": html.escape(str(event.get("summary") or "Unknown event")),
+        "timestamp": format_timestamp(event.get("timestamp", "")),
+    })
+
+
+def build_activity_list_html(events) -> str:
+    """Build the HTML for a list of activity items."""
+    return "<div>" + "".join(build_activity_item_html(e) for e in events) + "</div>"
+
+
+def render_activity_list(events) -> None:
+    """Render activity items as a single markdown element."""
+    st.markdown(build_activity_list_html(events), unsafe_allow_html=True)
+
+
+_MESSAGE_TMPL = (
+    '<div style="background: {bg_color}; border-radius: 12px; padding: 12px 16px; margin-bottom: 8px;">'
+    '<div style="display: flex; justify-content: space-between; margin-bottom: 8px;">'
+    '<span style="color: #9ca3af; font-size: 12px; font-weight: 600;">{label}</span>'
+    '<span style="color: #6b7280; font-size: 12px;">{timestamp}</span>'
+    '</div>'
+    '<div style="color: #e5e7eb; font-size: 14px; white-space: pre-wrap; word-wrap: break-word;">{content}</div>'
+    '</div>'
+)
 
 
 def render_message(msg: dict):
     """Render a chat message."""
-    role = msg.get("role", "unknown")
-    content = msg.get("content", "")
+    role = str(msg.get("role") or "unknown")
+    content = str(msg.get("content") or "")
     timestamp = format_timestamp(msg.get("timestamp", ""))
     
     if role == "user":
@@ -310,30 +748,73 @@ def render_message(msg: dict):
     display_content = content[:2000] + "..." if len(content) > 2000 else content
     
     st.markdown(
-        f"""
-        <div style="background: {bg_color}; border-radius: 12px; padding: 12px 16px; margin-bottom: 8px;">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 8px;">
-                <span style="color: #9ca3af; font-size: 12px; font-weight: 600;">{label}</span>
-                <span style="color: #6b7280; font-size: 12px;">{timestamp}</span>
-            </div>
-            <div style="color: #e5e7eb; font-size: 14px; white-space: pre-wrap; word-wrap: break-word;">{display_content}</div>
-        </div>
-        """,
+        _MESSAGE_TMPL.format_map({
+            "bg_color": bg_color,
+            "label": label,
+            "timestamp": timestamp,
+            "content": html.escape(display_content),
+        }),
         unsafe_allow_html=True,
     )
 
 
+def _widen_window(state_key: str, shown: int, step: int):
+    """Button callback: grow a list window; the click's own rerun shows it."""
+    st.session_state[state_key] = shown + step
+
+
+def render_load_more(state_key: str, shown: int, total: int):
+    """Render a button that widens a list window by LIST_PAGE_SIZE."""
+    if total > shown:
+        st.button(
+            f"Load more ({total - shown} remaining)",
+            key=f"{state_key}_more",
+            on_click=_widen_window,
+            args=(state_key, shown, LIST_PAGE_SIZE),
+        )
+
+
 # =============================================================================
 # Pages
 # =============================================================================
 
+def render_error(e: Exception):
+    """Render the error boundary's message and Retry button."""
+    st.error(f"Something went wrong: {e}")
+    st.info("Try refreshing the page. If the issue persists, data may be temporarily unavailable.")
+    # Loader caches are keyed on file mtime/size, so a plain rerun is
+    # enough to pick up fixed data without flushing every other entry
+    if st.button("🔄 Retry"):
+        st.rerun()
+
+
+def dashboard_page(run_every: Optional[int] = None):
+    """Decorate a page function to run as a fragment with its own error boundary.
+
+    Fragment reruns (Refresh, filters, Load more, Home's poll) never enter
+    main(), so each run starts its own data snapshot and catches its own
+    errors here.
+    """
+    def decorator(func):
+        @st.fragment(run_every=run_every)
+        @wraps(func)
+        def wrapper():
+            begin_run()
+            try:
+                func()
+            except Exception as e:
+                render_error(e)
+        return wrapper
+    return decorator
+
+@dashboard_page(run_every=REFRESH_INTERVAL if AUTO_REFRESH_ENABLED else None)
 def page_home():
     """Home/Overview page."""
     st.markdown("# 🎩 Alfred Mission Control")
     
     status = get_agent_status()
     sessions = get_sessions()
-    activity = get_activity_feed()
+    activity = get_activity_feed(limit=HOME_ACTIVITY_LIMIT)
     
     render_status_indicator(
         status.get("online", False),
@@ -346,7 +827,7 @@ def page_home():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        active_count = len([s for s in sessions if s.get("status") == "active"])
+        active_count = sum(1 for s in sessions if s.get("status") == "active")
         render_metric_card("Sessions", str(active_count), "active")
     
     with col2:
@@ -354,9 +835,9 @@ def page_home():
         render_metric_card("Sub-Agents", str(subagent_count), "running")
     
     with col3:
-        next_task = status.get("next_scheduled_task", {})
-        next_name = next_task.get("name", "—")
-        render_metric_card("Next Task", next_name[:12], "scheduled")
+        next_task = status.get("next_scheduled_task") or {}
+        next_name = str(next_task.get("name") or "—")
+        render_metric_card("Next Task", html.escape(next_name[:12]), "scheduled")
     
     st.markdown("---")
     
@@ -364,11 +845,10 @@ def page_home():
     st.markdown("### Recent Activity")
     
     if activity:
-        for event in reversed(activity[-10:]):
-            render_activity_item(event)
+        render_activity_list(reversed(activity))
         
-        if len(activity) > 10:
-            st.markdown(f"*... and {len(activity) - 10} more events*")
+        if len(activity) == HOME_ACTIVITY_LIMIT:
+            st.markdown("*Older events are in the 📋 Log tab*")
     else:
         st.info("No recent activity recorded. Activity will appear here as Alfred works.")
     
@@ -377,41 +857,59 @@ def page_home():
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown(
-            f'<div style="color: #6b7280; font-size: 11px;">v{VERSION} • Updated {datetime.now().strftime("%I:%M:%S %p")} • Auto-refresh {REFRESH_INTERVAL}s</div>',
+            _REFRESH_FOOTER.format(
+                version=VERSION,
+                updated=datetime.now().strftime("%I:%M:%S %p"),
+                interval=REFRESH_INTERVAL,
+            ),
             unsafe_allow_html=True,
         )
     with col2:
-        if st.button("🔄 Refresh"):
-            st.cache_data.clear()
-            st.rerun()
+        # The click itself reruns this fragment; no cache clearing needed, as
+        # the rerun re-stats Home's files and the (mtime_ns, size) cache keys
+        # pick up any change
+        st.button("🔄 Refresh")
 
 
+@dashboard_page()
 def page_sessions():
     """Sessions list page."""
     st.markdown("# Sessions")
     
-    sessions = get_sessions()
-    
     # Filter
     filter_option = st.selectbox(
         "Filter by type",
         ["All", "Main", "Sub-Agent", "Cron"],
     )
     
-    if filter_option != "All":
-        kind_map = {"Main": "main", "Sub-Agent": "subagent", "Cron": "cron"}
-        sessions = [s for s in sessions if s.get("kind") == kind_map.get(filter_option)]
+    sessions = get_sessions_by_kind().get(filter_option, [])
     
     st.markdown(f"**{len(sessions)} sessions**")
     st.markdown("---")
     
     if sessions:
-        for session in sessions:
+        shown_key = f"sessions_shown_{filter_option}"
+        shown = st.session_state.get(shown_key, LIST_PAGE_SIZE)
+        for session in sessions[:shown]:
             render_session_card(session)
+        render_load_more(shown_key, shown, len(sessions))
     else:
         st.info("No sessions found.")
 
 
+_SESSION_META_TMPL = (
+    '<div style="display: flex; gap: 24px; flex-wrap: wrap; margin-bottom: 8px;">'
+    '<div><div style="color: #9ca3af; font-size: 14px;">Status</div>'
+    '<div style="color: #ffffff; font-size: 28px; font-weight: 600;">{status}</div></div>'
+    '<div><div style="color: #9ca3af; font-size: 14px;">Type</div>'
+    '<div style="color: #ffffff; font-size: 28px; font-weight: 600;">{kind}</div></div>'
+    '<div><div style="color: #9ca3af; font-size: 14px;">Source</div>'
+    '<div style="color: #ffffff; font-size: 28px; font-weight: 600;">{source}</div></div>'
+    '</div>'
+)
+
+
+@dashboard_page()
 def page_session_detail():
     """Session detail page."""
     session_key = st.session_state.get("selected_session", "")
@@ -425,27 +923,39 @@ def page_session_detail():
     st.markdown(f"# Session: `{session_key}`")
     
     # Get session info
-    sessions = get_sessions()
-    session = next((s for s in sessions if s.get("key") == session_key), None)
+    session = get_sessions_by_key().get(session_key)
     
     if session:
-        status = session.get("status", "unknown")
-        kind = session.get("kind", "unknown")
-        source = session.get("metadata", {}).get("source", "unknown")
+        status = str(session.get("status") or "unknown")
+        kind = str(session.get("kind") or "unknown")
+        source = str((session.get("metadata") or {}).get("source") or "unknown")
         
-        col1, col2, col3 = st.columns(3)
-        col1.metric("Status", status.title())
-        col2.metric("Type", kind.title())
-        col3.metric("Source", source.title())
+        st.markdown(
+            _SESSION_META_TMPL.format_map({
+                "status": html.escape(status.title()),
+                "kind": html.escape(kind.title()),
+                "source": html.escape(source.title()),
+            }),
+            unsafe_allow_html=True,
+        )
         
         st.markdown("---")
     
-    # Get message history
-    messages = get_session_history(session_key)
+    # Get message history - only the most recent `shown` messages are parsed
+    limit_key = f"history_limit_{session_key}"
+    shown = st.session_state.get(limit_key, HISTORY_PAGE_SIZE)
+    messages, total = get_session_history(session_key, shown)
     
-    st.markdown(f"### Message History ({len(messages)} messages)")
+    st.markdown(f"### Message History ({total} messages)")
     
     if messages:
+        if total > len(messages):
+            st.button(
+                f"⬆ Load earlier ({total - len(messages)} more)",
+                key="history_load_earlier",
+                on_click=_widen_window,
+                args=(limit_key, shown, HISTORY_PAGE_SIZE),
+            )
         for msg in messages:
             render_message(msg)
     else:
@@ -455,77 +965,114 @@ def page_session_detail():
         )
 
 
+# Sub-agent completion status -> (color, icon); anything but success is a failure
+_FAILED_TASK_STYLE = ("#ef4444", "✗")
+_TASK_STATUS_STYLE = {"success": ("#22c55e", "✓"), "failed": _FAILED_TASK_STYLE}
+
+_RUNNING_TASK_TMPL = (
+    '<div style="background: #111827; border: 1px solid #eab308; border-radius: 12px; padding: 16px; margin-bottom: 8px;">'
+    '<div style="color: #eab308; font-weight: 600;">⏳ {task}</div>'
+    '<div style="color: #6b7280; font-size: 14px; margin-top: 4px;">Session: {session_key} • Started: {started}</div>'
+    '</div>'
+)
+
+_COMPLETED_TASK_TMPL = (
+    '<div style="background: #111827; border: 1px solid #1f2937; border-radius: 12px; padding: 16px; margin-bottom: 8px;">'
+    '<div style="display: flex; justify-content: space-between; align-items: center;">'
+    '<span style="color: #e5e7eb; font-weight: 600;">{status_icon} {session_key}</span>'
+    '<span style="color: {status_color}; font-size: 14px;">{status}</span>'
+    '</div>'
+    '<div style="color: #9ca3af; font-size: 14px; margin-top: 4px;">{summary}</div>'
+    '<div style="color: #6b7280; font-size: 12px; margin-top: 4px;">{finished}</div>'
+    '</div>'
+)
+
+
+@dashboard_page()
 def page_subagents():
     """Sub-agents page."""
     st.markdown("# Sub-Agents")
     
     tasks = get_subagent_tasks()
     
-    # Separate running vs completed
-    spawned_keys = {t.get("session_key") for t in tasks if t.get("event") == "spawned"}
-    completed_keys = {t.get("session_key") for t in tasks if t.get("event") == "completed"}
-    running_keys = spawned_keys - completed_keys
-    
-    running = [t for t in tasks if t.get("event") == "spawned" and t.get("session_key") in running_keys]
-    completed = [t for t in tasks if t.get("event") == "completed"]
+    # Separate running vs completed in one pass. A spawn stays running until
+    # a completion for its session key shows up, before or after it.
+    running_by_key = {}
+    completed_keys = set()
+    completed = []
+    for t in tasks:
+        event = t.get("event")
+        key = str(t.get("session_key"))  # Keys must be hashable
+        if event == "completed":
+            completed.append(t)
+            completed_keys.add(key)
+            running_by_key.pop(key, None)
+        elif event == "spawned" and key not in completed_keys:
+            running_by_key.setdefault(key, []).append(t)
+    running = [t for spawns in running_by_key.values() for t in spawns]
     
     st.markdown(f"### 🔄 Running ({len(running)})")
     
     if running:
+        html_parts = []
         for task in running:
-            st.markdown(
-                f"""
-                <div style="background: #111827; border: 1px solid #eab308; border-radius: 12px; padding: 16px; margin-bottom: 8px;">
-                    <div style="color: #eab308; font-weight: 600;">⏳ {task.get('task', 'Unknown task')}</div>
-                    <div style="color: #6b7280; font-size: 14px; margin-top: 4px;">
-                        Session: {task.get('session_key', 'unknown')} • Started: {format_time_ago(task.get('timestamp', ''))}
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            html_parts.append(_RUNNING_TASK_TMPL.format_map({
+                "task": html.escape(str(task.get("task") or "Unknown task")),
+                "session_key": html.escape(str(task.get("session_key") or "unknown")),
+                "started": format_time_ago(task.get("timestamp", "")),
+            }))
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
     else:
         st.markdown("*No sub-agents currently running*")
     
     st.markdown(f"### ✓ Recently Completed ({len(completed)})")
     
     if completed:
-        for task in reversed(completed[-10:]):
-            status = task.get("status", "unknown")
-            status_color = "#22c55e" if status == "success" else "#ef4444"
-            status_icon = "✓" if status == "success" else "✗"
-            summary = task.get("summary", "")[:100]
+        html_parts = []
+        for task in completed[-1:-11:-1]:  # Last 10, newest first
+            status = str(task.get("status") or "unknown")
+            status_color, status_icon = _TASK_STATUS_STYLE.get(status, _FAILED_TASK_STYLE)
             
-            st.markdown(
-                f"""
-                <div style="background: #111827; border: 1px solid #1f2937; border-radius: 12px; padding: 16px; margin-bottom: 8px;">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <span style="color: #e5e7eb; font-weight: 600;">{status_icon} {task.get('session_key', 'Unknown')}</span>
-                        <span style="color: {status_color}; font-size: 14px;">{status}</span>
-                    </div>
-                    <div style="color: #9ca3af; font-size: 14px; margin-top: 4px;">{summary}</div>
-                    <div style="color: #6b7280; font-size: 12px; margin-top: 4px;">{format_time_ago(task.get('timestamp', ''))}</div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            html_parts.append(_COMPLETED_TASK_TMPL.format_map({
+                "status": html.escape(status),
+                "status_color": status_color,
+                "status_icon": status_icon,
+                "session_key": html.escape(str(task.get("session_key") or "Unknown")),
+                "summary": html.escape(str(task.get("summary") or "")[:100]),
+                "finished": format_time_ago(task.get("timestamp", "")),
+            }))
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
     else:
         st.markdown("*No completed sub-agents recorded*")
 
 
+_DELIVERABLE_TYPE_ICONS = {
+    "document": "📄",
+    "spreadsheet": "📊",
+    "template": "📋",
+    "tool": "🔧",
+    "research": "🔍",
+    "sop": "📝",
+}
+
+_DELIVERABLE_TMPL = (
+    '<div style="background: #111827; border: 1px solid #1f2937; border-radius: 12px; padding: 16px; margin-bottom: 8px;">'
+    '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 4px;">'
+    '<span style="color: #ffffff; font-weight: 600;">{icon} {name}</span>'
+    '<span style="color: #6b7280; font-size: 12px;">{created}</span>'
+    '</div>'
+    '<div style="color: #9ca3af; font-size: 14px;">{description}</div>'
+    '<div style="color: #6b7280; font-size: 12px; margin-top: 8px; font-family: monospace;">{path}</div>'
+    '</div>'
+)
+
+
+@dashboard_page()
 def page_deliverables():
     """Deliverables catalog page."""
     st.markdown("# Deliverables")
     
-    deliverables = get_deliverables()
-    
-    # Group by category
-    categories = {}
-    for item in deliverables:
-        cat = item.get("category", "Uncategorized")
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(item)
+    categories = get_deliverables_grouped()
     
     # Filter
     if categories:
@@ -544,36 +1091,21 @@ def page_deliverables():
         for category, items in filtered.items():
             st.markdown(f"### 📁 {category}")
             
+            html_parts = []
             for item in items:
-                name = item.get("name", "Unnamed")
-                description = item.get("description", "")[:100]
-                path = item.get("path", "")
-                created = format_time_ago(item.get("created", "")) if item.get("created") else "—"
-                file_type = item.get("type", "document")
+                name = str(item.get("name") or "Unnamed")
+                description = item["description_short"]
+                path = str(item.get("path") or "")
+                icon = _DELIVERABLE_TYPE_ICONS.get(str(item.get("type", "document")), "📄")
                 
-                type_icons = {
-                    "document": "📄",
-                    "spreadsheet": "📊",
-                    "template": "📋",
-                    "tool": "🔧",
-                    "research": "🔍",
-                    "sop": "📝",
-                }
-                icon = type_icons.get(file_type, "📄")
-                
-                st.markdown(
-                    f"""
-                    <div style="background: #111827; border: 1px solid #1f2937; border-radius: 12px; padding: 16px; margin-bottom: 8px;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 4px;">
-                            <span style="color: #ffffff; font-weight: 600;">{icon} {name}</span>
-                            <span style="color: #6b7280; font-size: 12px;">{created}</span>
-                        </div>
-                        <div style="color: #9ca3af; font-size: 14px;">{description}</div>
-                        <div style="color: #6b7280; font-size: 12px; margin-top: 8px; font-family: monospace;">{path}</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+                html_parts.append(_DELIVERABLE_TMPL.format_map({
+                    "icon": icon,
+                    "name": html.escape(name),
+                    "created": format_time_ago(item.get("created") or "") or "—",
+                    "description": html.escape(description),
+                    "path": html.escape(path),
+                }))
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
     else:
         st.info(
             "No deliverables cataloged yet.\n\n"
@@ -582,10 +1114,45 @@ def page_deliverables():
     
     # Refresh button
     st.markdown("---")
-    if st.button("🔄 Refresh", key="deliverables_refresh"):
-        st.rerun()
+    st.button("🔄 Refresh", key="deliverables_refresh")  # The click reruns the fragment
+
+
+_ENABLED_JOB_TMPL = (
+    '<div style="background: #111827; border: 1px solid #22c55e; border-radius: 12px; padding: 16px; margin-bottom: 8px;">'
+    '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">'
+    '<span style="color: #ffffff; font-weight: 600;">⏰ {job_id}</span>'
+    '<span style="color: #22c55e; font-size: 14px;">enabled</span>'
+    '</div>'
+    '<div style="color: #9ca3af; font-size: 14px; margin-bottom: 8px;">{text}</div>'
+    '<div style="display: flex; gap: 24px;">'
+    '<div>'
+    '<span style="color: #6b7280; font-size: 12px;">Schedule:</span>'
+    '<span style="color: #e5e7eb; font-size: 12px; margin-left: 4px;">{schedule}</span>'
+    '</div>'
+    '<div>'
+    '<span style="color: #6b7280; font-size: 12px;">Next:</span>'
+    '<span style="color: #eab308; font-size: 12px; margin-left: 4px;">{next_display}</span>'
+    '</div>'
+    '<div>'
+    '<span style="color: #6b7280; font-size: 12px;">Last:</span>'
+    '<span style="color: #6b7280; font-size: 12px; margin-left: 4px;">{last_display}</span>'
+    '</div>'
+    '</div>'
+    '</div>'
+)
+
+_DISABLED_JOB_TMPL = (
+    '<div style="background: #111827; border: 1px solid #374151; border-radius: 12px; padding: 16px; margin-bottom: 8px; opacity: 0.6;">'
+    '<div style="display: flex; justify-content: space-between; align-items: center;">'
+    '<span style="color: #9ca3af; font-weight: 600;">⏸️ {job_id}</span>'
+    '<span style="color: #6b7280; font-size: 14px;">disabled</span>'
+    '</div>'
+    '<div style="color: #6b7280; font-size: 14px; margin-top: 4px;">{text}</div>'
+    '</div>'
+)
 
 
+@dashboard_page()
 def page_cron():
     """Cron jobs page."""
     st.markdown("# Scheduled Jobs")
@@ -599,242 +1166,151 @@ def page_cron():
     st.markdown(f"### ⏰ Active ({len(enabled_jobs)})")
     
     if enabled_jobs:
+        html_parts = []
         for job in enabled_jobs:
-            job_id = job.get("id", "unknown")
-            schedule = job.get("schedule", "—")
-            text = job.get("text", "")[:80]
+            job_id = str(job.get("id") or "unknown")
+            schedule = str(job.get("schedule") or "—")
+            text = job["text_short"]
             next_run = job.get("nextRun", "")
             last_run = job.get("lastRun", "")
             
             next_display = format_time_ago(next_run) if next_run else "—"
             last_display = format_time_ago(last_run) if last_run else "never"
             
-            st.markdown(
-                f"""
-                <div style="background: #111827; border: 1px solid #22c55e; border-radius: 12px; padding: 16px; margin-bottom: 8px;">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                        <span style="color: #ffffff; font-weight: 600;">⏰ {job_id}</span>
-                        <span style="color: #22c55e; font-size: 14px;">enabled</span>
-                    </div>
-                    <div style="color: #9ca3af; font-size: 14px; margin-bottom: 8px;">{text}</div>
-                    <div style="display: flex; gap: 24px;">
-                        <div>
-                            <span style="color: #6b7280; font-size: 12px;">Schedule:</span>
-                            <span style="color: #e5e7eb; font-size: 12px; margin-left: 4px;">{schedule}</span>
-                        </div>
-                        <div>
-                            <span style="color: #6b7280; font-size: 12px;">Next:</span>
-                            <span style="color: #eab308; font-size: 12px; margin-left: 4px;">{next_display}</span>
-                        </div>
-                        <div>
-                            <span style="color: #6b7280; font-size: 12px;">Last:</span>
-                            <span style="color: #6b7280; font-size: 12px; margin-left: 4px;">{last_display}</span>
-                        </div>
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            html_parts.append(_ENABLED_JOB_TMPL.format_map({
+                "job_id": html.escape(job_id),
+                "text": html.escape(text),
+                "schedule": html.escape(schedule),
+                "next_display": next_display,
+                "last_display": last_display,
+            }))
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
     else:
         st.markdown("*No active scheduled jobs*")
     
     if disabled_jobs:
         st.markdown(f"### 💤 Disabled ({len(disabled_jobs)})")
+        html_parts = []
         for job in disabled_jobs:
-            job_id = job.get("id", "unknown")
-            text = job.get("text", "")[:60]
-            
-            st.markdown(
-                f"""
-                <div style="background: #111827; border: 1px solid #374151; border-radius: 12px; padding: 16px; margin-bottom: 8px; opacity: 0.6;">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <span style="color: #9ca3af; font-weight: 600;">⏸️ {job_id}</span>
-                        <span style="color: #6b7280; font-size: 14px;">disabled</span>
-                    </div>
-                    <div style="color: #6b7280; font-size: 14px; margin-top: 4px;">{text}</div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            html_parts.append(_DISABLED_JOB_TMPL.format_map({
+                "job_id": html.escape(str(job.get("id") or "unknown")),
+                "text": html.escape(job["text_short"][:60]),
+            }))
+        st.markdown("".join(html_parts), unsafe_allow_html=True)
     
     # Refresh button
     st.markdown("---")
-    if st.button("🔄 Refresh", key="cron_refresh"):
-        st.rerun()
+    st.button("🔄 Refresh", key="cron_refresh")  # The click reruns the fragment
 
 
+@dashboard_page()
 def page_activity():
     """Activity feed page."""
     st.markdown("# Activity Feed")
     
-    activity = get_activity_feed()
-    
     filter_option = st.selectbox(
         "Filter by type",
         ["All", "Sessions", "Tasks", "Deliverables", "Errors"],
     )
     
-    if filter_option != "All":
-        type_map = {
-            "Sessions": ["session_started", "session_ended"],
-            "Tasks": ["task_started", "task_completed", "task_failed"],
-            "Deliverables": ["deliverable_created"],
-            "Errors": ["error_occurred", "task_failed"],
-        }
-        allowed_types = type_map.get(filter_option, [])
-        activity = [e for e in activity if e.get("type") in allowed_types]
+    activity = get_activity_by_type(limit=100)[filter_option]
     
     st.markdown(f"**{len(activity)} events**")
     st.markdown("---")
     
     if activity:
-        for event in reversed(activity):
-            render_activity_item(event)
+        shown_key = f"activity_shown_{filter_option}"
+        shown = st.session_state.get(shown_key, LIST_PAGE_SIZE)
+        # Feed HTML only depends on the visible window; reuse it until the
+        # filter, window or newest event changes
+        last = activity[-1]
+        fingerprint = (filter_option, shown, len(activity), last.get("id"), last.get("timestamp"))
+        if st.session_state.get("_activity_html_fp") != fingerprint:
+            st.session_state["_activity_html"] = build_activity_list_html(islice(reversed(activity), shown))
+            st.session_state["_activity_html_fp"] = fingerprint
+        st.markdown(st.session_state["_activity_html"], unsafe_allow_html=True)
+        render_load_more(shown_key, shown, len(activity))
     else:
         st.info("No activity recorded yet.")
     
     # Refresh button
     st.markdown("---")
-    if st.button("🔄 Refresh", key="activity_refresh"):
-        st.rerun()
+    st.button("🔄 Refresh", key="activity_refresh")  # The click reruns the fragment
 
 
 # =============================================================================
 # Main App
 # =============================================================================
 
+def _inject_css():
+    """Emit the app CSS.
+
+    Streamlit drops elements that are not re-emitted on a rerun, so this runs
+    every time rather than once per session; the string itself is a module
+    constant and is never rebuilt.
+    """
+    st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+
 def main():
     """Main app entry point."""
+    _inject_css()
     
-    # Error boundary for the whole app
+    # Error boundary for the whole app; pages also catch their own errors,
+    # since fragment reruns never come through here
     try:
         _main_content()
     except Exception as e:
-        st.error(f"Something went wrong: {e}")
-        st.info("Try refreshing the page. If the issue persists, data may be temporarily unavailable.")
-        if st.button("🔄 Retry"):
-            st.cache_data.clear()
-            st.rerun()
+        render_error(e)
 
 
 def _main_content():
     """Main app content (wrapped for error handling)."""
     
-    # Auto-refresh
-    if AUTO_REFRESH_ENABLED and HAS_AUTOREFRESH:
-        # Using streamlit-autorefresh for reliable auto-refresh
-        st_autorefresh(interval=REFRESH_INTERVAL * 1000, limit=None, key="auto_refresh")
-    elif AUTO_REFRESH_ENABLED:
-        # Fallback: meta refresh tag
-        st.markdown(
-            f'<meta http-equiv="refresh" content="{REFRESH_INTERVAL}">',
-            unsafe_allow_html=True,
-        )
-    
-    # Custom CSS with mobile optimization
-    st.markdown(
-        """
-        <style>
-            /* Base dark theme */
-            .stApp { background-color: #030712; }
-            .stMarkdown { color: #e5e7eb; }
-            section[data-testid="stSidebar"] { background-color: #111827; }
-            
-            /* Buttons - larger touch targets */
-            .stButton > button {
-                background-color: #1f2937;
-                color: #e5e7eb;
-                border: 1px solid #374151;
-                min-height: 44px;
-                padding: 8px 16px;
-            }
-            .stButton > button:hover {
-                background-color: #374151;
-                border-color: #4b5563;
-            }
-            
-            /* Form elements */
-            .stSelectbox > div > div { background-color: #1f2937; color: #e5e7eb; }
-            
-            /* Tabs - responsive */
-            .stTabs [data-baseweb="tab-list"] { 
-                gap: 4px;
-                flex-wrap: wrap;
-            }
-            .stTabs [data-baseweb="tab"] {
-                background-color: #1f2937;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #9ca3af;
-                font-size: 14px;
-                min-height: 44px;
-            }
-            .stTabs [aria-selected="true"] {
-                background-color: #374151;
-                color: #ffffff;
-            }
-            
-            /* Mobile-specific styles */
-            @media (max-width: 768px) {
-                /* Smaller text on mobile */
-                .stMarkdown h1 { font-size: 1.5rem !important; }
-                .stMarkdown h3 { font-size: 1.1rem !important; }
-                
-                /* Stack tabs vertically on very small screens */
-                .stTabs [data-baseweb="tab-list"] {
-                    gap: 2px;
-                }
-                .stTabs [data-baseweb="tab"] {
-                    padding: 6px 8px;
-                    font-size: 12px;
-                }
-                
-                /* Metric cards stack better */
-                .stMetric { padding: 8px !important; }
-                
-                /* Cards full width */
-                [data-testid="column"] {
-                    padding: 0 4px !important;
-                }
-            }
-            
-            /* Hide Streamlit branding */
-            #MainMenu { visibility: hidden; }
-            footer { visibility: hidden; }
-            
-            /* Smooth transitions */
-            * { transition: background-color 0.2s, border-color 0.2s; }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # Auto-refresh. Home polls itself as a run_every fragment, so the
+    # whole-app timer is only needed on the other tabs.
+    active_tab = st.session_state.get("active_tab", NAV_TABS[0])
+    if AUTO_REFRESH_ENABLED and active_tab != NAV_TABS[0]:
+        if HAS_AUTOREFRESH:
+            # Using streamlit-autorefresh for reliable auto-refresh. The timer
+            # is keyed per tab so switching tabs restarts it instead of firing
+            # a rerun straight after the page was just rendered.
+            st_autorefresh(interval=REFRESH_INTERVAL * 1000, limit=None, key=f"auto_refresh_{active_tab}")
+        else:
+            # Fallback: meta refresh tag
+            st.markdown(
+                f'<meta http-equiv="refresh" content="{REFRESH_INTERVAL}">',
+                unsafe_allow_html=True,
+            )
     
     # Initialize session state
     if "page" not in st.session_state:
         st.session_state.page = "home"
     
-    # Navigation tabs (compact labels)
-    tabs = st.tabs(["🏠 Home", "💬 Chat", "🤖 Agents", "⏰ Jobs", "📦 Files", "📋 Log"])
+    # Navigation (compact labels). st.tabs renders every pane on each rerun,
+    # so a radio is used instead and only the selected page executes.
+    active_tab = st.radio(
+        "Navigation",
+        NAV_TABS,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_tab",
+    )
     
-    with tabs[0]:
+    if active_tab == "🏠 Home":
         page_home()
-    
-    with tabs[1]:
+    elif active_tab == "💬 Chat":
         if st.session_state.page == "session_detail":
             page_session_detail()
         else:
             page_sessions()
-    
-    with tabs[2]:
+    elif active_tab == "🤖 Agents":
         page_subagents()
-    
-    with tabs[3]:
+    elif active_tab == "⏰ Jobs":
         page_cron()
-    
-    with tabs[4]:
+    elif active_tab == "📦 Files":
         page_deliverables()
-    
-    with tabs[5]:
+    elif active_tab == "📋 Log":
         page_activity()
 
 